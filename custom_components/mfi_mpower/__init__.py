@@ -15,12 +15,10 @@ PLATFORMS: list[Platform] = [Platform.SWITCH, Platform.SENSOR]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up integration from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-
-    coordinator = await api.create_coordinator(hass, dict(entry.data))
+    coordinator = await api.create_coordinator(hass, entry.data)
     api_device = coordinator.api_device
 
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
@@ -51,13 +49,12 @@ async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: ConfigEntry, device_entry: DeviceEntry
 ) -> bool:
     """Remove a config entry from a device."""
-    device_id = device_entry.id
-
     entity_registry = er.async_get(hass)
-    entity_device_ids = {entry.device_id for entry in entity_registry.entities.values()}
 
     # Allow only removal of orphaned port devices
-    if device_id not in entity_device_ids:
+    if not er.async_entries_for_device(
+        entity_registry, device_entry.id, include_disabled_entities=True
+    ):
         return True
 
     # Allow removal of port devices
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 import logging
 from typing import Any
 
@@ -29,68 +30,129 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
-from .const import DEFAULTS
+from .const import DEFAULTS, DOMAIN
 from .update_coordinator import MPowerDataUpdateCoordinator
 
 # pylint: enable=unused-import
 
 
+__all__ = [
+    "DATA_COORDINATORS",
+    "MPowerAPIAuthError",
+    "MPowerAPIConnError",
+    "MPowerAPIDataError",
+    "MPowerAPIReadError",
+    "MPowerDataUpdateCoordinator",
+    "MPowerDevice",
+    "MPowerEntity",
+    "MPowerSSHConnError",
+    "MPowerSensor",
+    "MPowerSwitch",
+    "UPDATE_ATTEMPTS",
+    "UPDATE_BACKOFF",
+    "UpdateHandler",
+    "create_coordinator",
+    "create_data",
+    "create_device",
+    "create_key",
+    "get_coordinator",
+    "update_device",
+]
+
 _LOGGER = logging.getLogger(__name__)
 
 # Reduce verbosity level from asyncssh
 if _LOGGER.level in (logging.NOTSET, logging.INFO):
     asyncssh.logging.set_log_level(logging.WARNING)
 
+DATA_COORDINATORS = f"{DOMAIN}_coordinators"
+
+UPDATE_ATTEMPTS = 3
+UPDATE_BACKOFF = 0.1
+
+_INFLIGHT_UPDATES: dict[int, asyncio.Future[None]] = {}
+
+
+def create_key(data: Mapping[str, Any]) -> tuple:
+    """Construct a key identifying the connection settings from config data."""
+    return (
+        data.get(CONF_HOST, DEFAULTS[CONF_HOST]),
+        data.get(CONF_USERNAME, DEFAULTS[CONF_USERNAME]),
+        data.get(CONF_PASSWORD, DEFAULTS[CONF_PASSWORD]),
+        data.get(CONF_SSL, DEFAULTS[CONF_SSL]),
+        data.get(CONF_VERIFY_SSL, DEFAULTS[CONF_VERIFY_SSL]),
+    )
+
 
 def create_data(
     hass: HomeAssistant,
-    data: dict[str, Any],
+    data: Mapping[str, Any],
 ) -> dict:
     """Construct API data to create MPowerDevice instances from hass and config data."""
-    assert all(
-        [
-            MPowerDevice,
-            MPowerEntity,
-            MPowerSensor,
-            MPowerSwitch,
-            MPowerAPIConnError,
-            MPowerAPIAuthError,
-            MPowerAPIReadError,
-            MPowerAPIDataError,
-        ]
-    )
-    session = async_create_clientsession(hass, verify_ssl=data[CONF_VERIFY_SSL])
+    host, username, password, use_ssl, verify_ssl = create_key(data)
+
+    session = async_create_clientsession(hass, verify_ssl=verify_ssl)
 
     return {
-        "host": data.get(CONF_HOST, DEFAULTS[CONF_HOST]),
-        "username": data.get(CONF_USERNAME, DEFAULTS[CONF_USERNAME]),
-        "password": data.get(CONF_PASSWORD, DEFAULTS[CONF_PASSWORD]),
-        "use_ssl": data.get(CONF_SSL, DEFAULTS[CONF_SSL]),
-        "verify_ssl": data.get(CONF_VERIFY_SSL, DEFAULTS[CONF_VERIFY_SSL]),
+        "host": host,
+        "username": username,
+        "password": password,
+        "use_ssl": use_ssl,
+        "verify_ssl": verify_ssl,
         "cache_time": 0,
         "board_info": True,
         "session": session,
     }
 
 
-async def create_device(hass: HomeAssistant, data: dict[str, Any]) -> MPowerDevice:
+async def create_device(hass: HomeAssistant, data: Mapping[str, Any]) -> MPowerDevice:
     """Construct a new MPowerDevice instance from hass and config data."""
     return MPowerDevice(**create_data(hass, data))
 
 
 async def update_device(api_device: MPowerDevice) -> None:
     """Update a MPowerDevice instance."""
+    key = id(api_device)
+
+    # NOTE: Concurrent updates of the same device share a single update run
+    if (inflight := _INFLIGHT_UPDATES.get(key)) is not None:
+        return await asyncio.shield(inflight)
+
+    future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    _INFLIGHT_UPDATES[key] = future
+    try:
+        await _update_device(api_device)
+        future.set_result(None)
+    except asyncio.CancelledError:
+        # NOTE: Waiting updates fail instead of inheriting the leader's cancellation
+        future.set_exception(asyncio.TimeoutError())
+        future.exception()  # Mark as retrieved if there are no other waiters
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        future.exception()  # Mark as retrieved if there are no other waiters
+        raise
+    finally:
+        _INFLIGHT_UPDATES.pop(key)
+
+
+async def _update_device(api_device: MPowerDevice) -> None:
+    """Update a MPowerDevice instance with retries."""
     async with UpdateHandler() as handler:
-        while True:
+        for attempt in range(UPDATE_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(UPDATE_BACKOFF * 2 ** (attempt - 1))
             try:
                 await api_device.update()
-                break
+                return
             except Exception as exc:  # pylint: disable=broad-except
                 handler.handle(exc)
 
+    raise MPowerAPIConnError(f"Update of {api_device.host} failed after retries")
+
 
 async def create_coordinator(
-    hass: HomeAssistant, data: dict[str, Any]
+    hass: HomeAssistant, data: Mapping[str, Any]
 ) -> MPowerDataUpdateCoordinator:
     """Construct coordinator instance from hass and config data."""
 
@@ -110,15 +172,35 @@ async def create_coordinator(
     return coordinator
 
 
+async def get_coordinator(
+    hass: HomeAssistant, data: Mapping[str, Any]
+) -> MPowerDataUpdateCoordinator:
+    """Return a shared coordinator instance from hass and config data."""
+    scan_interval = data.get(CONF_SCAN_INTERVAL, DEFAULTS[CONF_SCAN_INTERVAL])
+    key = (*create_key(data), scan_interval)
+
+    # NOTE: Platforms set up concurrently with identical settings share one
+    # coordinator (and its polling), which is forgotten once it has been created
+    tasks: dict[tuple, asyncio.Task] = hass.data.setdefault(DATA_COORDINATORS, {})
+    if (task := tasks.get(key)) is None:
+        task = tasks[key] = hass.async_create_task(create_coordinator(hass, data))
+        task.add_done_callback(lambda _: tasks.pop(key, None))
+
+    return await asyncio.shield(task)
+
+
 class UpdateHandler:
     """
     Update handler.
 
     This class handles a possible SSH BrokenPipeError bug - which may occur if the
     debug mode of the event loop is enabled - by means of disabling it temporarily.
+
+    The scope counter is shared by all handlers since the debug mode is a property of
+    the event loop. It is only changed without awaiting in between and therefore
+    needs no lock.
     """
 
-    lock: asyncio.Lock = asyncio.Lock()
     counter: int = 0
 
     def __init__(self) -> None:
@@ -1,85 +1,87 @@
 """Config flow for Ubiquiti mFi mPower integration."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
+import hashlib
 import logging
+import time
 from typing import Any
 
-import voluptuous as vol
-
 from homeassistant import config_entries
 from homeassistant.const import (
     CONF_HOST,
     CONF_PASSWORD,
-    CONF_SCAN_INTERVAL,
     CONF_SSL,
     CONF_USERNAME,
     CONF_VERIFY_SSL,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers import selector
-import homeassistant.helpers.config_validation as cv
 
 from . import api
-from .const import DEFAULT_TIMEOUT, DEFAULTS, DOMAIN
+from .const import DEFAULT_TIMEOUT, DOMAIN
+from .schema import create_schema
 
 _LOGGER = logging.getLogger(__name__)
 
+VALIDATION_KEYS = (CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SSL, CONF_VERIFY_SSL)
+VALIDATION_CACHE_SIZE = 16
+VALIDATION_CACHE_TTL = 10
+VALIDATION_CACHE_RESULTS = ("invalid_auth",)
 
-def create_schema(data=None, conf: tuple | list | None = None):
-    """Construct schema from config data."""
-    if data is None:
-        data = DEFAULTS
-
-    schema = {
-        vol.Required(
-            CONF_HOST, default=data.get(CONF_HOST, DEFAULTS[CONF_HOST])
-        ): cv.string,
-        vol.Required(
-            CONF_USERNAME, default=data.get(CONF_USERNAME, DEFAULTS[CONF_USERNAME])
-        ): cv.string,
-        vol.Required(
-            CONF_PASSWORD, default=data.get(CONF_PASSWORD, DEFAULTS[CONF_PASSWORD])
-        ): cv.string,
-        vol.Optional(
-            CONF_SSL, default=data.get(CONF_SSL, DEFAULTS[CONF_SSL])
-        ): cv.boolean,
-        vol.Optional(
-            CONF_VERIFY_SSL,
-            default=data.get(CONF_VERIFY_SSL, DEFAULTS[CONF_VERIFY_SSL]),
-        ): cv.boolean,
-        vol.Optional(
-            CONF_SCAN_INTERVAL,
-            default=data.get(CONF_SCAN_INTERVAL, DEFAULTS[CONF_SCAN_INTERVAL]),
-        ): selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=DEFAULT_TIMEOUT,
-                mode=selector.NumberSelectorMode.BOX,
-                unit_of_measurement="seconds",
-            ),
-        ),
-    }
-
-    if conf is not None:
-        for key in list(schema.keys()):
-            if key.schema not in conf:
-                schema.pop(key)
-
-    return vol.Schema(schema)
+_VALIDATION_CACHE: dict[str, tuple[float, str | None]] = {}
+_VALIDATION_INFLIGHT: dict[str, asyncio.Future[str | None]] = {}
 
 
 async def validate_data(hass: HomeAssistant, data: dict[str, Any]) -> str | None:
     """Validate the config data allows us to connect."""
-
+    # NOTE: Keys are hashed to not keep plaintext passwords around
+    key = hashlib.sha256(
+        repr(tuple(data.get(conf) for conf in VALIDATION_KEYS)).encode()
+    ).hexdigest()
+
+    # NOTE: Resubmitting identical data shortly after reuses the previous result
+    cached = _VALIDATION_CACHE.pop(key, None)
+    if cached is not None and time.monotonic() - cached[0] < VALIDATION_CACHE_TTL:
+        _VALIDATION_CACHE[key] = cached
+        return cached[1]
+
+    # NOTE: Concurrent validations of identical data share a single run
+    if (inflight := _VALIDATION_INFLIGHT.get(key)) is not None:
+        return await asyncio.shield(inflight)
+
+    future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+    _VALIDATION_INFLIGHT[key] = future
     try:
-        api_device = await api.create_device(hass, data)
-    except Exception:  # pylint: disable=broad-except
-        return "input_error"
+        error = await _validate_data(hass, data)
+        future.set_result(error)
+    except asyncio.CancelledError:
+        # NOTE: Waiting flows get an error result instead of the leader's cancellation
+        future.set_result("cannot_connect")
+        raise
+    finally:
+        _VALIDATION_INFLIGHT.pop(key)
+
+    # NOTE: Success is not cached (setup depends on the device being reachable) and
+    # neither are connection errors since the device may be back any moment
+    if error not in VALIDATION_CACHE_RESULTS:
+        return error
+
+    _VALIDATION_CACHE[key] = (time.monotonic(), error)
+    while len(_VALIDATION_CACHE) > VALIDATION_CACHE_SIZE:
+        _VALIDATION_CACHE.pop(next(iter(_VALIDATION_CACHE)))
 
+    return error
+
+
+async def _validate_data(hass: HomeAssistant, data: dict[str, Any]) -> str | None:
+    """Validate the config data allows us to connect (uncached)."""
     try:
-        await api_device.login()
-    except api.MPowerAPIConnError:
+        api_device = await api.create_device(hass, data)
+        async with asyncio.timeout(DEFAULT_TIMEOUT):
+            await api_device.login()
+    except (asyncio.TimeoutError, OSError, api.MPowerAPIConnError):
         return "cannot_connect"
     except api.MPowerAPIAuthError:
         return "invalid_auth"
@@ -131,22 +133,18 @@ class MPowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the reauth confirmation step."""
-        data = dict(self._reauth_entry.data)
+        data: Mapping[str, Any] = self._reauth_entry.data
         error = None
 
         if user_input:
-            data.update(user_input)
+            data = {**data, **user_input}
             error = await validate_data(self.hass, data=data)
 
             # NOTE: If data is validated, the entry is updated and reloaded
             if not error:
-                self.hass.config_entries.async_update_entry(
-                    self._reauth_entry, data=data
-                )
-                self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(self._reauth_entry.entry_id)
+                return self.async_update_reload_and_abort(
+                    self._reauth_entry, data=data, reason="reauth_successful"
                 )
-                return self.async_abort(reason="reauth_successful")
 
         return self.async_show_form(
             step_id="reauth_confirm",
@@ -1,6 +1,8 @@
 """Constants for the Ubiquiti mFi mPower integration."""
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from homeassistant.const import (
     CONF_HOST,
     CONF_PASSWORD,
@@ -16,11 +18,13 @@ NAME = "Ubiquiti mFi mPower"
 
 DEFAULT_TIMEOUT = 15
 
-DEFAULTS = {
-    CONF_HOST: None,
-    CONF_USERNAME: "ubnt",
-    CONF_PASSWORD: "ubnt",
-    CONF_SSL: True,
-    CONF_VERIFY_SSL: False,
-    CONF_SCAN_INTERVAL: 30,
-}
+DEFAULTS = MappingProxyType(
+    {
+        CONF_HOST: None,
+        CONF_USERNAME: "ubnt",
+        CONF_PASSWORD: "ubnt",
+        CONF_SSL: True,
+        CONF_VERIFY_SSL: False,
+        CONF_SCAN_INTERVAL: 30,
+    }
+)
@@ -0,0 +1,38 @@
+"""Platform setup helpers for the Ubiquiti mFi mPower integration."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType
+
+from . import api
+from .const import DOMAIN
+from .update_coordinator import MPowerDataUpdateCoordinator
+
+CreateEntities = Callable[[MPowerDataUpdateCoordinator], Awaitable[list[Any]]]
+
+
+async def async_setup_from_config(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    create_entities: CreateEntities,
+) -> None:
+    """Set up Ubiquiti mFi mPower platform entities based on config."""
+    coordinator = await api.get_coordinator(hass, config[DOMAIN])
+    async_add_entities(await create_entities(coordinator), False)
+
+
+async def async_setup_from_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    create_entities: CreateEntities,
+) -> None:
+    """Set up Ubiquiti mFi mPower platform entities based on config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(await create_entities(coordinator), False)
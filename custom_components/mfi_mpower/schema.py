@@ -0,0 +1,73 @@
+"""Config schema helpers for the Ubiquiti mFi mPower integration."""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_SSL,
+    CONF_USERNAME,
+    CONF_VERIFY_SSL,
+)
+from homeassistant.helpers import selector
+import homeassistant.helpers.config_validation as cv
+
+from .const import DEFAULT_TIMEOUT, DEFAULTS
+
+SCAN_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=DEFAULT_TIMEOUT,
+        mode=selector.NumberSelectorMode.BOX,
+        unit_of_measurement="seconds",
+    ),
+)
+
+
+def create_schema(
+    data: Mapping[str, Any] | None = None, conf: Sequence[str] | None = None
+) -> vol.Schema:
+    """Construct schema from config data."""
+    if data is None:
+        data = DEFAULTS
+
+    keys = _FIELD_BUILDERS if conf is None else conf
+
+    return vol.Schema(dict(_FIELD_BUILDERS[key](data) for key in keys))
+
+
+def _default(data: Mapping[str, Any], key: str) -> Any:
+    """Return config value or its default."""
+    return data.get(key, DEFAULTS[key])
+
+
+_FIELD_BUILDERS: dict[str, Callable[[Mapping[str, Any]], tuple[vol.Marker, Any]]] = {
+    CONF_HOST: lambda data: (
+        vol.Required(CONF_HOST, default=_default(data, CONF_HOST)),
+        cv.string,
+    ),
+    CONF_USERNAME: lambda data: (
+        vol.Required(CONF_USERNAME, default=_default(data, CONF_USERNAME)),
+        cv.string,
+    ),
+    CONF_PASSWORD: lambda data: (
+        vol.Required(CONF_PASSWORD, default=_default(data, CONF_PASSWORD)),
+        cv.string,
+    ),
+    CONF_SSL: lambda data: (
+        vol.Optional(CONF_SSL, default=_default(data, CONF_SSL)),
+        cv.boolean,
+    ),
+    CONF_VERIFY_SSL: lambda data: (
+        vol.Optional(CONF_VERIFY_SSL, default=_default(data, CONF_VERIFY_SSL)),
+        cv.boolean,
+    ),
+    CONF_SCAN_INTERVAL: lambda data: (
+        vol.Optional(CONF_SCAN_INTERVAL, default=_default(data, CONF_SCAN_INTERVAL)),
+        SCAN_INTERVAL_SELECTOR,
+    ),
+}
@@ -10,14 +10,14 @@ from homeassistant.const import (
     UnitOfElectricPotential,
     UnitOfPower,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import api
-from .config_flow import create_schema
-from .const import DOMAIN
+from .platform_setup import async_setup_from_config, async_setup_from_entry
+from .schema import create_schema
 from .update_coordinator import MPowerCoordinatorEntity, MPowerDataUpdateCoordinator
 
 PLATFORM_SCHEMA = sensor.PLATFORM_SCHEMA.extend(create_schema().schema)
@@ -30,9 +30,9 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up Ubiquiti mFi mPower sensors based on config."""
-    coordinator = await api.create_coordinator(hass, config[DOMAIN])
-    entities = await async_create_entities(coordinator)
-    async_add_entities(entities, False)
+    await async_setup_from_config(
+        hass, config, async_add_entities, async_create_entities
+    )
 
 
 async def async_setup_entry(
@@ -41,9 +41,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Ubiquiti mFi mPower sensors based on config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = await async_create_entities(coordinator)
-    async_add_entities(entities, False)
+    await async_setup_from_entry(hass, entry, async_add_entities, async_create_entities)
 
 
 async def async_create_entities(
@@ -57,11 +55,15 @@ async def async_create_entities(
     except Exception as exc:
         raise PlatformNotReady from exc
 
+    entity_classes: tuple[type[MPowerSensorEntity], ...] = (
+        MPowerPowerSensorEntity,
+        MPowerCurrentSensorEntity,
+        MPowerVoltageSensorEntity,
+        MPowerPowerFactorSensorEntity,
+    )
+
     entities: list[MPowerSensorEntity] = [
-        *[MPowerPowerSensorEntity(e, coordinator) for e in api_entities],
-        *[MPowerCurrentSensorEntity(e, coordinator) for e in api_entities],
-        *[MPowerVoltageSensorEntity(e, coordinator) for e in api_entities],
-        *[MPowerPowerFactorSensorEntity(e, coordinator) for e in api_entities],
+        cls(e, coordinator) for e in api_entities for cls in entity_classes
     ]
 
     return entities
@@ -70,100 +72,63 @@ async def async_create_entities(
 class MPowerSensorEntity(MPowerCoordinatorEntity, SensorEntity):
     """Coordinated sensor entity for Ubiquiti mFi mPower sensors."""
 
+    api_entity: api.MPowerSensor
+
     domain: str = sensor.DOMAIN
 
+    _value_attr: str
+    _value_precision: int
+
+    @callback
+    def _handle_attr_update(self) -> None:
+        """Update entity attributes from the api entity."""
+        value = getattr(self.api_entity, self._value_attr)
+        self._attr_native_value = round(value, self._value_precision)
+
 
 class MPowerPowerSensorEntity(MPowerSensorEntity):
     """Coordinated sensor entity for Ubiquiti mFi mPower power sensors."""
 
-    api_entity: api.MPowerSensor
-
     _attr_device_class = SensorDeviceClass.POWER
     _attr_name = "Power"
+    _attr_native_unit_of_measurement = UnitOfPower.WATT
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique id of the sensor."""
-        return f"{self.api_entity.unique_id}-power"
-
-    @property
-    def native_value(self) -> float:
-        """Return the native value of the sensor."""
-        return round(self.api_entity.power, 2)
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the native unit of measurement of the sensor."""
-        return UnitOfPower.WATT
+    _unique_id_suffix = "power"
+    _value_attr = "power"
+    _value_precision = 2
 
 
 class MPowerCurrentSensorEntity(MPowerSensorEntity):
     """Coordinated sensor entity for Ubiquiti mFi mPower current sensors."""
 
-    api_entity: api.MPowerSensor
-
     _attr_device_class = SensorDeviceClass.CURRENT
     _attr_name = "Current"
+    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique id of the sensor."""
-        return f"{self.api_entity.unique_id}-current"
-
-    @property
-    def native_value(self) -> float:
-        """Return the native value of the sensor."""
-        return round(self.api_entity.current, 3)
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the native unit of measurement of the sensor."""
-        return UnitOfElectricCurrent.AMPERE
+    _unique_id_suffix = "current"
+    _value_attr = "current"
+    _value_precision = 3
 
 
 class MPowerVoltageSensorEntity(MPowerSensorEntity):
     """Coordinated sensor entity for Ubiquiti mFi mPower voltage sensors."""
 
-    api_entity: api.MPowerSensor
-
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_name = "Voltage"
+    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique id of the sensor."""
-        return f"{self.api_entity.unique_id}-voltage"
-
-    @property
-    def native_value(self) -> float:
-        """Return the native value of the sensor."""
-        return round(self.api_entity.voltage, 2)
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the native unit of measurement of the sensor."""
-        return UnitOfElectricPotential.VOLT
+    _unique_id_suffix = "voltage"
+    _value_attr = "voltage"
+    _value_precision = 2
 
 
 class MPowerPowerFactorSensorEntity(MPowerSensorEntity):
     """Coordinated factor sensor entity for Ubiquiti mFi mPower power sensors."""
 
-    api_entity: api.MPowerSensor
-
     _attr_device_class = SensorDeviceClass.POWER_FACTOR
     _attr_name = "Power factor"
+    _attr_native_unit_of_measurement = PERCENTAGE
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique id of the sensor."""
-        return f"{self.api_entity.unique_id}-powerfactor"
-
-    @property
-    def native_value(self) -> float:
-        """Return the native value of the sensor."""
-        return round(self.api_entity.powerfactor, 3)
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return the native unit of measurement of the sensor."""
-        return PERCENTAGE
+    _unique_id_suffix = "powerfactor"
+    _value_attr = "powerfactor"
+    _value_precision = 3
@@ -1,13 +1,18 @@
 """Helper to test significant Ubiquiti mFi mPower state changes."""
 from __future__ import annotations
 
-import logging
 from typing import Any
 
+from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import ATTR_DEVICE_CLASS
 from homeassistant.core import HomeAssistant, callback
 
-_LOGGER = logging.getLogger(__name__)
+SIGNIFICANT_CHANGE_THRESHOLDS: dict[str, float] = {
+    SensorDeviceClass.POWER: 1.0,
+    SensorDeviceClass.CURRENT: 0.01,
+    SensorDeviceClass.VOLTAGE: 1.0,
+    SensorDeviceClass.POWER_FACTOR: 1.0,  # Reported in percent
+}
 
 
 @callback
@@ -20,11 +25,16 @@ def async_check_significant_change(
     **kwargs: Any,
 ) -> bool | None:
     """Test if state significantly changed."""
-    device_class = new_attrs.get(ATTR_DEVICE_CLASS)
+    threshold = SIGNIFICANT_CHANGE_THRESHOLDS.get(new_attrs.get(ATTR_DEVICE_CLASS))
 
-    _LOGGER.debug(device_class)
+    if threshold is None:
+        return None
 
-    if device_class is None:
+    try:
+        if abs(float(new_state) - float(old_state)) >= threshold:
+            return True
+    except (TypeError, ValueError):
         return None
 
-    return None
+    # NOTE: Changes below the threshold are still significant if attributes changed
+    return old_attrs != new_attrs
@@ -6,14 +6,14 @@ from typing import Any
 from homeassistant.components import switch
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import api
-from .config_flow import create_schema
-from .const import DOMAIN
+from .platform_setup import async_setup_from_config, async_setup_from_entry
+from .schema import create_schema
 from .update_coordinator import MPowerCoordinatorEntity, MPowerDataUpdateCoordinator
 
 PLATFORM_SCHEMA = switch.PLATFORM_SCHEMA.extend(create_schema().schema)
@@ -26,9 +26,9 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up Ubiquiti mFi mPower switches based on config."""
-    coordinator = await api.create_coordinator(hass, config[DOMAIN])
-    entities = await async_create_entities(coordinator)
-    async_add_entities(entities, False)
+    await async_setup_from_config(
+        hass, config, async_add_entities, async_create_entities
+    )
 
 
 async def async_setup_entry(
@@ -37,9 +37,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Ubiquiti mFi mPower switches based on config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = await async_create_entities(coordinator)
-    async_add_entities(entities, False)
+    await async_setup_from_entry(hass, entry, async_add_entities, async_create_entities)
 
 
 async def async_create_entities(
@@ -70,6 +68,19 @@ class MPowerSwitchEntity(MPowerCoordinatorEntity, SwitchEntity):
     _attr_device_class = SwitchDeviceClass.OUTLET
     _attr_name = "Output"
 
+    _unique_id_suffix = "switch"
+
+    def __init__(
+        self, api_entity: api.MPowerSwitch, coordinator: MPowerDataUpdateCoordinator
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(api_entity, coordinator)
+
+        if self.api_device.eu_model:
+            self._attr_icon = "mdi:power-socket-de"
+        else:
+            self._attr_icon = "mdi:power-socket-us"
+
     @property
     def available(self) -> bool:
         """Return the availability of the switch."""
@@ -77,29 +88,26 @@ class MPowerSwitchEntity(MPowerCoordinatorEntity, SwitchEntity):
             return False
         return super().available
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique id of the switch."""
-        return f"{self.api_entity.unique_id}-switch"
-
-    @property
-    def icon(self) -> str | None:
-        """Return the icon of the switch."""
-        if self.api_device.eu_model:
-            return "mdi:power-socket-de"
-        return "mdi:power-socket-us"
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if the switch is on."""
-        return self.api_entity.output
+    @callback
+    def _handle_attr_update(self) -> None:
+        """Update entity attributes from the api entity."""
+        self._attr_is_on = self.api_entity.output
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         await self.api_entity.turn_on(refresh=False)
-        await self.coordinator.async_request_refresh()
+        self._async_write_optimistic_state(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         await self.api_entity.turn_off(refresh=False)
-        await self.coordinator.async_request_refresh()
+        self._async_write_optimistic_state(False)
+
+    @callback
+    def _async_write_optimistic_state(self, is_on: bool) -> None:
+        """Write the expected state and refresh the actual one in the background."""
+        self._attr_is_on = is_on
+        self._port_data = None  # Force a write on the next coordinator update
+        self.async_write_ha_state()
+
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
 from datetime import timedelta
+from functools import lru_cache
 import logging
+import time
+from types import MappingProxyType
 
-import async_timeout
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr, entity_registry as er
@@ -23,6 +26,15 @@ from .const import DEFAULT_TIMEOUT, DOMAIN, NAME
 
 _LOGGER = logging.getLogger(__name__)
 
+UPDATE_TIMEOUT_FACTOR = 3
+UPDATE_TIME_SMOOTHING = 0.2
+
+
+@lru_cache(maxsize=256)
+def _slugify(text: str) -> str:
+    """Slugify text with results cached for repeated names."""
+    return slugify(text)
+
 
 class MPowerDataUpdateCoordinator(DataUpdateCoordinator):
     """Ubiquiti mFi mPower data update coordinator."""
@@ -38,22 +50,49 @@ class MPowerDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=scan_interval),
         )
         self._api_device = device
+        self._update_time: float | None = None
 
-    async def _async_update_data(self) -> list[dict]:
+        self.device_registry = dr.async_get(hass)
+        self.entity_registry = er.async_get(hass)
+
+    @property
+    def update_timeout(self) -> float:
+        """Return the timeout for the next update."""
+        if not self.api_device.updated:
+            return SLOW_SETUP_MAX_WAIT
+        if self._update_time is None:
+            return DEFAULT_TIMEOUT
+        update_timeout = UPDATE_TIMEOUT_FACTOR * self._update_time
+        return min(max(DEFAULT_TIMEOUT, update_timeout), SLOW_SETUP_MAX_WAIT)
+
+    async def _async_update_data(self) -> Mapping[int, dict]:
         """Fetch data from the device."""
         try:
-            updated = self.api_device.updated
-            timeout = DEFAULT_TIMEOUT if updated else SLOW_SETUP_MAX_WAIT
-            async with async_timeout.timeout(timeout):
+            start = time.monotonic()
+            async with asyncio.timeout(self.update_timeout):
                 await api.update_device(self.api_device)
-        except asyncio.TimeoutError as exc:
-            raise asyncio.TimeoutError(exc) from exc
+            elapsed = time.monotonic() - start
         except api.MPowerAPIAuthError as exc:
             raise ConfigEntryAuthFailed(exc) from exc
         except Exception as exc:
             raise UpdateFailed(exc) from exc
 
-        return self.api_device.port_data
+        # Track smoothed duration of successful updates
+        if self._update_time is None:
+            self._update_time = elapsed
+        else:
+            self._update_time += UPDATE_TIME_SMOOTHING * (elapsed - self._update_time)
+
+        # NOTE: Port data is copied once per update and keyed by port number (only the
+        # mapping is read-only, the port dicts are handed to the api entities as is)
+        port_data = MappingProxyType(
+            {
+                port: dict(data)
+                for port, data in enumerate(self.api_device.port_data, start=1)
+            }
+        )
+
+        return port_data
 
     @property
     def api_device(self) -> api.MPowerDevice:
@@ -66,12 +105,15 @@ class MPowerCoordinatorEntity(CoordinatorEntity):
 
     api_entity: api.MPowerEntity
     api_device: api.MPowerDevice
+    coordinator: MPowerDataUpdateCoordinator
 
     domain: str | None = None
 
     _attr_assumed_state = False
     _attr_has_entity_name = True
 
+    _unique_id_suffix: str | None = None
+
     def __init__(
         self, api_entity: api.MPowerEntity, coordinator: MPowerDataUpdateCoordinator
     ) -> None:
@@ -79,64 +121,111 @@ class MPowerCoordinatorEntity(CoordinatorEntity):
         self.api_entity = api_entity
         self.api_device = api_entity.device
         self.api_label = None
+        self._port_data: dict | None = None
+        self._update_success: bool | None = None
+        self._device_name = self._create_device_name()
 
         super().__init__(coordinator)
 
+        assert self._unique_id_suffix is not None
+        self._attr_unique_id = f"{api_entity.unique_id}-{self._unique_id_suffix}"
+
+        assert self.domain is not None
+        self._entity_id_prefix = f"{self.domain}."
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, api_entity.unique_id)},
+            name=self._device_name,
+            manufacturer=self.api_device.manufacturer,
+            model=f"{self.api_device.model} Port {api_entity.port}",
+            via_device=(DOMAIN, self.api_device.unique_id),
+        )
+
+        self._handle_attr_update()
+
+    @callback
+    def _handle_attr_update(self) -> None:
+        """Update entity attributes from the api entity."""
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        data = self.coordinator.data
+        coordinator = self.coordinator
+        api_entity = self.api_entity
+        data = coordinator.data
 
         if data is not None:
-            self.api_entity.data = data[self.api_entity.port - 1]
+            port = api_entity.port
+            port_data = data.get(port)
+            if port_data is None:
+                _LOGGER.debug("No data for port %s", port)
+                return
+
+            update_success = coordinator.last_update_success
+
+            # NOTE: Nothing is written if neither port data nor availability changed
+            if update_success is self._update_success and port_data == self._port_data:
+                return
+
+            self._port_data = port_data
+            self._update_success = update_success
+
+            api_entity.data = port_data
 
             # Check if api entity label has changed
-            if self.api_entity.label != self.api_label:
+            label = api_entity.label
+            if label != self.api_label:
                 # Adjust device name
-                device_registry = dr.async_get(self.hass)
-                device_registry.async_update_device(
-                    self.registry_entry.device_id,
-                    name=self.device_name,
-                )
-
-                # Adjust entity id
-                assert self.domain is not None
-                entity_registry = er.async_get(self.hass)
-                new_object_id = slugify(f"{self.device_name} {self.name}")
-                try:
-                    new_entity_id = f"{self.domain}.{new_object_id}"
-                    entity_registry.async_update_entity(
-                        self.entity_id,
-                        new_entity_id=new_entity_id,
-                    )
-                except ValueError:
-                    new_entity_id = entity_registry.async_generate_entity_id(
-                        self.domain, new_object_id
-                    )
-                    entity_registry.async_update_entity(
-                        self.entity_id,
-                        new_entity_id=new_entity_id,
-                    )
+                self._device_name = self._create_device_name()
+                self._attr_device_info["name"] = self._device_name
+
+                # NOTE: Registry updates are deferred to not delay the state write
+                self.hass.loop.call_soon(self._async_update_registries)
 
                 # Update api label
-                self.api_label = self.api_entity.label
+                self.api_label = label
 
+            self._handle_attr_update()
             self.async_write_ha_state()
 
-    @property
-    def device_name(self) -> str:
-        """Return the device name of the entity."""
+    @callback
+    def _async_update_registries(self) -> None:
+        """Update the device and entity registry after a label change."""
+        if (registry_entry := self.registry_entry) is None:
+            return
+
+        # Adjust device name
+        device_registry = self.coordinator.device_registry
+        device_registry.async_update_device(
+            registry_entry.device_id,
+            name=self.device_name,
+        )
+
+        # Adjust entity id
+        entity_registry = self.coordinator.entity_registry
+        new_object_id = _slugify(f"{self.device_name} {self.name}")
+        new_entity_id = self._entity_id_prefix + new_object_id
+        if new_entity_id == registry_entry.entity_id:
+            return
+
+        # NOTE: An occupied entity id is checked up front to rename only once
+        available = not entity_registry.async_is_registered(new_entity_id)
+        if not (available and self.hass.states.async_available(new_entity_id)):
+            new_entity_id = entity_registry.async_generate_entity_id(
+                self.domain, new_object_id
+            )
+        entity_registry.async_update_entity(
+            registry_entry.entity_id,
+            new_entity_id=new_entity_id,
+        )
+
+    def _create_device_name(self) -> str:
+        """Construct the device name of the entity."""
         if self.api_entity.label:
             return self.api_entity.label
         return f"{self.api_device.name} port {self.api_entity.port}"
 
     @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return the device info for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.api_entity.unique_id)},
-            name=self.device_name,
-            manufacturer=self.api_device.manufacturer,
-            model=f"{self.api_device.model} Port {self.api_entity.port}",
-            via_device=(DOMAIN, self.api_device.unique_id),
-        )
+    def device_name(self) -> str:
+        """Return the device name of the entity."""
+        return self._device_name